@@ -8,9 +8,36 @@ import re
 import warnings
 import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional
 warnings.filterwarnings('ignore')
 
+# Prefer the Rust-based calamine reader (values only, no cell styles) when
+# installed and supported (pandas 2.2+); otherwise let pandas pick its
+# default engine (openpyxl).
+_PANDAS_VERSION = tuple(int(part) for part in re.match(r'(\d+)\.(\d+)', pd.__version__).groups())
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READER_ENGINE = 'calamine' if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    EXCEL_READER_ENGINE = None
+
+# Prefer the faster xlsxwriter for the report when installed.
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_WRITER_ENGINE = 'xlsxwriter'
+except ImportError:
+    from openpyxl.utils import get_column_letter
+    EXCEL_WRITER_ENGINE = 'openpyxl'
+
+# Store apartment IDs in a contiguous Arrow buffer when pyarrow is installed.
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = 'string'
+
 
 # ============================================================================
 # PROJECT CONFIGURATION (replace placeholders before running)
@@ -35,18 +62,64 @@ SHEET_TO_COMPLEX_RULES = []
 MIXED_SHEET_KEYWORDS = []
 
 
+# ============================================================================
+# OUTPUT LAYOUT
+# ============================================================================
+
+# Standardized columns extracted from every sheet.
+OUTPUT_COLUMNS = ['GROUP', 'ROOMS', 'ID', 'AREA', 'PRICE_PER_M2', 'TOTAL_PRICE']
+
+
+# ============================================================================
+# PRECOMPILED PATTERNS
+# ============================================================================
+
+_WS_RE = re.compile(r'\s+')
+_DIGIT_RE = re.compile(r'(\d+)')
+
+# Currency cleanup in one pass: drop spaces, '$' and NBSP, decimal comma -> dot.
+# The multi-character 'uah' suffix is removed separately.
+_CURRENCY_TABLE = str.maketrans({' ': None, '$': None, '\xa0': None, ',': '.'})
+
+# Configured ID markers and rules, uppercased once for case-insensitive matching.
+_EXCLUDED_UP = tuple(marker.upper() for marker in EXCLUDED_ID_MARKERS)
+_ID_RULES_UP = tuple((rule['id_contains'].upper(), rule['complex_name']) for rule in ID_TO_COMPLEX_RULES)
+_EXCLUDED_ID_RE = re.compile('|'.join(re.escape(marker) for marker in _EXCLUDED_UP)) if _EXCLUDED_UP else None
+
+# Rows matched per vectorized pass when searching for the header row.
+_HEADER_SCAN_BLOCK = 50
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=8192)
+def _normalize_str(text: str) -> str:
+    """Lowercase, strip and collapse whitespace (cached)"""
+    text = text.lower().strip()
+    # Remove extra spaces
+    return _WS_RE.sub(' ', text)
+
+
 def normalize_text(text) -> str:
     """Normalize text for better column matching"""
     if pd.isna(text):
         return ""
-    text = str(text).lower().strip()
-    # Remove extra spaces
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    # The same column keywords are normalized on every sheet, so results are cached
+    return _normalize_str(str(text))
+
+
+def normalize_headers(columns) -> pd.Series:
+    """Vectorized normalize_text over column names (positional Series)"""
+    headers = pd.Series(columns)
+    normalized = headers.astype(str).str.lower().str.strip().str.replace(_WS_RE, ' ', regex=True)
+    return normalized.where(headers.notna(), '')
+
+
+def keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one regex matching any of them literally"""
+    return re.compile('|'.join(re.escape(kw) for kw in keywords))
 
 
 def find_best_column(df: pd.DataFrame, candidates_list: List[List[str]],
@@ -62,20 +135,20 @@ def find_best_column(df: pd.DataFrame, candidates_list: List[List[str]],
     Returns:
         Column name if found, None otherwise
     """
-    exclude_keywords = exclude_keywords or []
+    col_norm = normalize_headers(df.columns)
 
-    # Normalize column names
-    col_map = {normalize_text(col): col for col in df.columns}
+    # Columns hit by any exclusion keyword can never be returned
+    exclude_keywords = [normalize_text(excl) for excl in (exclude_keywords or [])]
+    allowed = ~col_norm.str.contains(keyword_pattern(exclude_keywords)) if exclude_keywords else True
 
-    # Try each priority level
+    # Try each priority level: one regex pass over all column names
     for candidates in candidates_list:
-        for col_norm, col_orig in col_map.items():
-            # Check if any candidate keyword is in column name
-            if any(normalize_text(keyword) in col_norm for keyword in candidates):
-                # Check exclusions
-                if exclude_keywords and any(normalize_text(excl) in col_norm for excl in exclude_keywords):
-                    continue
-                return col_orig
+        if not candidates:
+            continue
+        pattern = keyword_pattern([normalize_text(kw) for kw in candidates])
+        hit = col_norm.str.contains(pattern) & allowed
+        if hit.any():
+            return df.columns[hit.argmax()]
 
     return None
 
@@ -85,8 +158,7 @@ def clean_currency(val) -> Optional[float]:
     if pd.isna(val):
         return None
 
-    s = str(val).replace(' ', '').replace('$', '').replace('uah', '')
-    s = s.replace(',', '.').replace('\xa0', '')
+    s = str(val).translate(_CURRENCY_TABLE).replace('uah', '')
 
     try:
         return float(s)
@@ -100,7 +172,7 @@ def extract_room_count(val) -> Optional[int]:
         return None
 
     # Look for first digit
-    match = re.search(r'(\d+)', str(val))
+    match = _DIGIT_RE.search(str(val))
     if match:
         rooms = int(match.group(1))
         # Only return 1, 2, or 3
@@ -110,6 +182,23 @@ def extract_room_count(val) -> Optional[int]:
     return None
 
 
+def clean_currency_series(values: pd.Series) -> pd.Series:
+    """Vectorized clean_currency: returns float Series with NaN for unparsable cells"""
+    # Columns holding only numeric cells need no string cleaning
+    values = values.infer_objects()
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.astype(float)
+
+    s = values.astype(str).str.translate(_CURRENCY_TABLE).str.replace('uah', '', regex=False)
+    return pd.to_numeric(s, errors='coerce')
+
+
+def extract_room_count_series(values: pd.Series) -> pd.Series:
+    """Vectorized extract_room_count: returns float Series with NaN outside 1-3"""
+    rooms = pd.to_numeric(values.astype(str).str.extract(_DIGIT_RE, expand=False), errors='coerce')
+    return rooms.where(rooms.isin([1, 2, 3]))
+
+
 def find_header_row(df: pd.DataFrame, keywords: List[str] = None) -> int:
     """
     Find the header row index by looking for key column names.
@@ -123,10 +212,19 @@ def find_header_row(df: pd.DataFrame, keywords: List[str] = None) -> int:
     """
     keywords = [normalize_text(kw) for kw in (keywords or ['ID', 'Status', 'Area', 'Price'])]
 
-    for i, row in df.iterrows():
-        normalized_cells = [normalize_text(cell) for cell in row.tolist()]
-        if any(any(kw in cell for kw in keywords) for cell in normalized_cells):
-            return i
+    pattern = keyword_pattern(keywords)
+
+    # Scan in blocks: the header is usually near the top, and each block is
+    # matched column-wise in one vectorized pass.
+    for start in range(0, len(df), _HEADER_SCAN_BLOCK):
+        block = df.iloc[start:start + _HEADER_SCAN_BLOCK]
+        matches = block.apply(
+            lambda col: col.astype(str).str.lower().str.strip().str.replace(_WS_RE, ' ', regex=True)
+            .str.contains(pattern, na=False)
+        )
+        hits = (matches & block.notna()).any(axis=1)
+        if hits.any():
+            return hits.index[hits.argmax()]
 
     return 0  # Default to first row
 
@@ -135,7 +233,7 @@ def find_header_row(df: pd.DataFrame, keywords: List[str] = None) -> int:
 # MAIN PROCESSING FUNCTIONS
 # ============================================================================
 
-def process_sheet(df: pd.DataFrame, sheet_name: str, verbose: bool = False) -> List[Dict]:
+def process_sheet(df: pd.DataFrame, sheet_name: str, verbose: bool = False) -> Dict[str, List]:
     """
     Process a single sheet and extract standardized data.
 
@@ -144,7 +242,7 @@ def process_sheet(df: pd.DataFrame, sheet_name: str, verbose: bool = False) -> L
         sheet_name: Name of the sheet
 
     Returns:
-        List of dictionaries with standardized data
+        Dictionary mapping each standardized column (OUTPUT_COLUMNS) to its list of values
     """
 
     # Find header row
@@ -165,71 +263,42 @@ def process_sheet(df: pd.DataFrame, sheet_name: str, verbose: bool = False) -> L
     # COLUMN IDENTIFICATION (PRIORITY ORDER)
     # ========================================================================
 
+    # Normalize every header once; each rule below is a vectorized test
+    col_str = pd.Series(df.columns).astype(str).str.strip()
+    col_norm = normalize_headers(df.columns)
+
+    def has(text: str) -> pd.Series:
+        return col_norm.str.contains(text, regex=False)
+
+    def first_match(mask: pd.Series):
+        # First column (in sheet order) satisfying the rule, if any
+        return df.columns[mask.argmax()] if mask.any() else None
+
     # 1. Price per meter - Look for "price per meter" (standard price, NOT discount)
-    price_m2_col = None
-    for col in df.columns:
-        col_str = str(col).strip()
-        col_norm = normalize_text(col)
-        # Priority 1: Exact "price per meter" (with possible trailing space)
-        if col_norm == 'price per meter' or col_str == 'price per meter ':
-            price_m2_col = col
-            break
+    price_m2_col = first_match(col_norm == 'price per meter')
 
     # Fallback: For different sheets
-    if not price_m2_col:
-        for col in df.columns:
-            col_norm = normalize_text(col)
+    if price_m2_col is None:
+        price_m2_col = first_match(
             # Example fallback pattern with extra notes in the source header text.
-            if 'price per 1 m' in col_norm and 'delete' in col_norm:
-                price_m2_col = col
-                break
+            (has('price per 1 m') & has('delete'))
             # Generic sale-price-per-meter fallback.
-            elif ('price' in col_norm and 'm' in col_norm and 'sale' in col_norm):
-                if 'base' not in col_norm and 'start' not in col_norm:
-                    price_m2_col = col
-                    break
+            | (has('price') & has('m') & has('sale') & ~has('base') & ~has('start'))
+        )
 
     # 2. Total Price - Look for "sale price" (standard, NOT discount)
-    total_price_col = None
-    for col in df.columns:
-        col_norm = normalize_text(col)
-        # Priority: "sale price"
-        if 'sale price' in col_norm:
-            total_price_col = col
-            break
-
-    # Fallback pattern with extra notes in the source header text.
-    if not total_price_col:
-        for col in df.columns:
-            col_norm = normalize_text(col)
-            if 'price' in col_norm and 'delete' in col_norm:
-                total_price_col = col
-                break
-            # Last fallback: "total price"
-            elif 'total price' in col_norm:
-                total_price_col = col
-                break
+    total_price_col = first_match(has('sale price'))
+
+    # Fallback pattern with extra notes in the source header text,
+    # then "total price" as the last fallback.
+    if total_price_col is None:
+        total_price_col = first_match((has('price') & has('delete')) | has('total price'))
 
     # 4. Rooms - Must be exact "Rooms" not "Size markup"
-    rooms_col = None
-    for col in df.columns:
-        col_str = str(col).strip()
-        # Exact match or close variants
-        if col_str in ['Rooms', 'Room Count', 'Room', 'Size']:
-            rooms_col = col
-            break
-        # If not found, try lowercase match
-        if normalize_text(col) == 'rooms':
-            rooms_col = col
-            break
+    rooms_col = first_match(col_str.isin(['Rooms', 'Room Count', 'Room', 'Size']) | (col_norm == 'rooms'))
 
     # 5. Area - Must be exact "Area" not "updated area"
-    area_col = None
-    for col in df.columns:
-        col_norm = normalize_text(col)
-        if col_norm == 'area':  # Exact match only
-            area_col = col
-            break
+    area_col = first_match(col_norm == 'area')
 
     # 6. Status - Look for "Status" column specifically
     status_col = find_best_column(df, [
@@ -256,124 +325,159 @@ def process_sheet(df: pd.DataFrame, sheet_name: str, verbose: bool = False) -> L
         print(f"    Status: {status_col}")
         print(f"    Complex: {complex_col}")
 
+    # Without these columns no row can pass the filters below
+    if (price_m2_col is None and total_price_col is None) or rooms_col is None \
+            or area_col is None or status_col is None:
+        if verbose:
+            print("  Missing required columns, skipping")
+        return {col: [] for col in OUTPUT_COLUMNS}
+
     # ========================================================================
     # DATA EXTRACTION
     # ========================================================================
 
-    results = []
-
-    for idx, row in df.iterrows():
-        # Get status
-        status_val = str(row.get(status_col, '')).lower() if status_col else ''
-
-        # Filter: Only "available"
-        if 'available' not in status_val:
-            continue
-
-        # Get room count
-        rooms = extract_room_count(row.get(rooms_col)) if rooms_col else None
-        if rooms not in [1, 2, 3]:
-            continue
-
-        # Get area
-        area = pd.to_numeric(row.get(area_col), errors='coerce') if area_col else None
-        if pd.isna(area) or area <= 0:
-            continue
-
-        # Get prices
-        price_m2 = clean_currency(row.get(price_m2_col)) if price_m2_col else None
-        total_price = clean_currency(row.get(total_price_col)) if total_price_col else None
-
-        # Skip if both prices are missing
-        if price_m2 is None and total_price is None:
-            continue
-
-        # Get complex name
-        if complex_col and not pd.isna(row.get(complex_col)):
-            complex_name = str(row.get(complex_col)).strip()
-        else:
-            # Use sheet name as complex name
-            complex_name = sheet_name
-
-        # Get ID
-        apt_id = str(row.get(id_col, '')).strip() if id_col else ''
-
-        # Skip rows by configured ID markers.
-        if any(marker.upper() in apt_id.upper() for marker in EXCLUDED_ID_MARKERS):
-            continue
+    # Sheet-level rules depend only on the sheet name, so resolve them once.
+    sheet_lower = sheet_name.lower()
+    is_mixed = any(keyword.lower() in sheet_lower for keyword in MIXED_SHEET_KEYWORDS)
+    sheet_override = next(
+        (rule['complex_name'] for rule in SHEET_TO_COMPLEX_RULES
+         if rule['sheet_contains'].lower() in sheet_lower),
+        None
+    )
 
-        # Determine complex from ID if this is a mixed sheet.
-        if any(keyword.lower() in sheet_name.lower() for keyword in MIXED_SHEET_KEYWORDS):
-            apt_id_upper = apt_id.upper()
-            for rule in ID_TO_COMPLEX_RULES:
-                if rule['id_contains'].upper() in apt_id_upper:
-                    complex_name = rule['complex_name']
-                    break
-
-        # Standardize complex names from sheet-name rules.
-        for rule in SHEET_TO_COMPLEX_RULES:
-            if rule['sheet_contains'].lower() in sheet_name.lower():
-                complex_name = rule['complex_name']
-                break
-
-        results.append({
-            'GROUP': complex_name,
-            'ROOMS': rooms,
-            'ID': apt_id,
-            'AREA': area,
-            'PRICE_PER_M2': price_m2,
-            'TOTAL_PRICE': total_price,
-        })
+    def column(col) -> pd.Series:
+        # Missing columns behave like an all-empty column
+        if col is None:
+            return pd.Series(None, index=df.index, dtype=object)
+        return df[col]
+
+    # Filter: Only "available"
+    mask = column(status_col).astype(str).str.lower().str.contains('available', regex=False, na=False)
+
+    # Room count: only 1, 2 or 3
+    rooms = extract_room_count_series(column(rooms_col))
+    mask &= rooms.notna()
+
+    # Area must be a positive number
+    area = pd.to_numeric(column(area_col), errors='coerce')
+    mask &= area > 0
+
+    # Skip if both prices are missing
+    price_m2 = clean_currency_series(column(price_m2_col))
+    total_price = clean_currency_series(column(total_price_col))
+    mask &= price_m2.notna() | total_price.notna()
+
+    # Get ID
+    if id_col is not None:
+        # fillna('nan') reproduces str(nan) for empty ID cells, which astype(str) leaves missing
+        apt_ids = column(id_col)[mask].astype(str).fillna('nan').str.strip()
+    else:
+        apt_ids = pd.Series('', index=df.index[mask], dtype=object)
+    apt_ids_upper = apt_ids.str.upper()
+
+    # Skip rows by configured ID markers: one combined pattern scans each ID once.
+    if _EXCLUDED_ID_RE is not None:
+        keep = ~apt_ids_upper.str.contains(_EXCLUDED_ID_RE, na=False)
+        apt_ids, apt_ids_upper = apt_ids[keep], apt_ids_upper[keep]
+
+    # Determine complex from ID if this is a mixed sheet (first matching rule wins).
+    id_complex = pd.Series(None, index=apt_ids.index, dtype=object)
+    if is_mixed:
+        for id_contains_up, complex_name in _ID_RULES_UP:
+            hit = id_complex.isna() & apt_ids_upper.str.contains(id_contains_up, regex=False)
+            id_complex[hit] = complex_name
+
+    rows = apt_ids.index
+
+    # Get complex name: complex column, else the sheet name
+    if complex_col is not None:
+        complex_raw = column(complex_col)[rows]
+        complex_names = complex_raw.astype(str).str.strip()
+        groups = complex_names.where(complex_raw.notna() & (complex_names != ''), sheet_name)
+    else:
+        groups = pd.Series(sheet_name, index=rows, dtype=object)
+
+    # ID-based names from mixed sheets take precedence
+    groups = id_complex.where(id_complex.notna(), groups)
+
+    # Standardize complex names from sheet-name rules.
+    if sheet_override is not None:
+        groups = pd.Series(sheet_override, index=rows, dtype=object)
+
+    results = {
+        'GROUP': groups.tolist(),
+        'ROOMS': rooms[rows].astype(int).tolist(),
+        'ID': apt_ids.tolist(),
+        'AREA': area[rows].tolist(),
+        'PRICE_PER_M2': price_m2[rows].tolist(),
+        'TOTAL_PRICE': total_price[rows].tolist(),
+    }
 
     if verbose:
-        print(f"  Extracted {len(results)} available apartments")
+        print(f"  Extracted {len(rows)} available apartments")
 
     return results
 
 
-def generate_summary(data: List[Dict]) -> pd.DataFrame:
+def _process_one_sheet(file_path: str, sheet_name: str, verbose: bool = False) -> Dict[str, List]:
+    """Read and process one sheet (top-level so worker processes can run it)"""
+    df = pd.read_excel(file_path, sheet_name=sheet_name, header=None, engine=EXCEL_READER_ENGINE)
+    return process_sheet(df, sheet_name, verbose=verbose)
+
+
+def generate_summary(data: Dict[str, List]) -> pd.DataFrame:
     """
     Generate summary pivot table from extracted data.
 
     Args:
-        data: List of apartment dictionaries
+        data: Dictionary of apartment column lists, as returned by process_sheet
 
     Returns:
         Summary DataFrame
     """
-    if not data:
+    if not data or not data['GROUP']:
         return pd.DataFrame()
 
-    df = pd.DataFrame(data)
+    # Compact dtypes: low-cardinality keys group on integer codes instead of
+    # Python objects. Values stay float64 so reported figures are exact.
+    df = pd.DataFrame(data).astype({
+        'GROUP': 'category',
+        'ROOMS': 'int8',
+        'ID': STRING_DTYPE,
+        'AREA': 'float64',
+        'PRICE_PER_M2': 'float64',
+        'TOTAL_PRICE': 'float64',
+    })
 
     # Remove rows with missing critical values
     df = df.dropna(subset=['PRICE_PER_M2', 'TOTAL_PRICE'])
+    if df.empty:
+        return pd.DataFrame()
 
-    results = []
-
-    # Group by Complex and Room Count
-    for (complex_name, room_count), group in df.groupby(['GROUP', 'ROOMS']):
-
-        # Find extremes with their IDs
-        min_area_row = group.loc[group['AREA'].idxmin()]
-        max_area_row = group.loc[group['AREA'].idxmax()]
-
-        min_price_row = group.loc[group['PRICE_PER_M2'].idxmin()]
-        max_price_row = group.loc[group['PRICE_PER_M2'].idxmax()]
-
-        cheapest_row = group.loc[group['TOTAL_PRICE'].idxmin()]
-
-        results.append({
-            'GROUP': complex_name,
-            'ROOMS': str(room_count),
-            'MIN_AREA': f"{min_area_row['AREA']:.1f}",
-            'MAX_AREA': f"{max_area_row['AREA']:.1f}",
-            'MIN_PRICE_PER_M2': f"{min_price_row['PRICE_PER_M2']:,.0f} ({min_price_row['ID']})",
-            'MAX_PRICE_PER_M2': f"{max_price_row['PRICE_PER_M2']:,.0f} ({max_price_row['ID']})",
-            'MIN_TOTAL_PRICE': f"{cheapest_row['TOTAL_PRICE']:,.0f} ({cheapest_row['ID']})"
-        })
-
-    summary = pd.DataFrame(results)
+    # Group by Complex and Room Count, locating extremes in one pass.
+    # The result is sorted below, so skip the groupby sort.
+    agg = df.groupby(['GROUP', 'ROOMS'], observed=True, sort=False).agg(
+        min_area=('AREA', 'min'),
+        max_area=('AREA', 'max'),
+        min_pm2_idx=('PRICE_PER_M2', 'idxmin'),
+        max_pm2_idx=('PRICE_PER_M2', 'idxmax'),
+        cheapest_idx=('TOTAL_PRICE', 'idxmin'),
+    ).reset_index()
+
+    def value_with_id(idx_col: str, value_col: str) -> pd.Series:
+        # Gather the extreme rows in bulk and format as "value (ID)"
+        rows = df.loc[agg[idx_col], [value_col, 'ID']].reset_index(drop=True)
+        return rows[value_col].map('{:,.0f}'.format) + ' (' + rows['ID'].astype(str) + ')'
+
+    summary = pd.DataFrame({
+        'GROUP': agg['GROUP'],
+        'ROOMS': agg['ROOMS'].astype(str),
+        'MIN_AREA': agg['min_area'].map('{:.1f}'.format),
+        'MAX_AREA': agg['max_area'].map('{:.1f}'.format),
+        'MIN_PRICE_PER_M2': value_with_id('min_pm2_idx', 'PRICE_PER_M2'),
+        'MAX_PRICE_PER_M2': value_with_id('max_pm2_idx', 'PRICE_PER_M2'),
+        'MIN_TOTAL_PRICE': value_with_id('cheapest_idx', 'TOTAL_PRICE'),
+    })
 
     # Sort by Complex and Room count
     summary = summary.sort_values(by=['GROUP', 'ROOMS'])
@@ -401,7 +505,8 @@ def main(
 
     print("GENERIC EXCEL PROCESSOR")
 
-    all_data = []
+    # Column-wise accumulators, one list per standardized column
+    all_data = {col: [] for col in OUTPUT_COLUMNS}
 
     # Sheets to process (configured at file top)
     sheets_to_process = SHEETS_TO_PROCESS
@@ -415,39 +520,64 @@ def main(
 
     # Load Excel file
     try:
-        xl_file = pd.ExcelFile(file_path)
+        xl_file = pd.ExcelFile(file_path, engine=EXCEL_READER_ENGINE)
     except Exception as e:
         print(f"❌ Error loading Excel file: {e}")
         return
 
+    available_sheets = set(xl_file.sheet_names)
+    sheets_found = []
     for sheet_name in sheets_to_process:
-        if sheet_name not in xl_file.sheet_names:
+        if sheet_name not in available_sheets:
             print(f"⚠️  Sheet '{sheet_name}' not found, skipping...")
             continue
-
-        if verbose:
-            print(f"\n{'='*80}")
-            print(f"Processing: {sheet_name}")
-            print(f"{'='*80}")
-        else:
-            print(f"Processing: {sheet_name}...")
-
-        try:
-            # Read sheet
-            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None)
-
-            # Process sheet
-            sheet_data = process_sheet(df, sheet_name, verbose=verbose)
-
-            # Add to all data
-            all_data.extend(sheet_data)
-            print(f"  -> {len(sheet_data)} available apartments")
-
-        except Exception as e:
-            print(f"❌ Error processing sheet '{sheet_name}': {e}")
+        sheets_found.append(sheet_name)
+
+    # Sheets are independent, so with several sheets and CPUs read and process
+    # them in worker processes (each worker re-opens the workbook). Otherwise
+    # parse serially from the workbook already opened above. Verbose runs stay
+    # serial so each sheet's diagnostics print in order under its banner.
+    # Results are collected in configured order to keep the report stable.
+    max_workers = min(len(sheets_found), os.cpu_count() or 1)
+    use_pool = max_workers > 1 and not verbose
+    executor = ProcessPoolExecutor(max_workers=max_workers) if use_pool else None
+    try:
+        futures = []
+        if executor is not None:
+            futures = [
+                executor.submit(_process_one_sheet, file_path, sheet_name)
+                for sheet_name in sheets_found
+            ]
+
+        for idx, sheet_name in enumerate(sheets_found):
             if verbose:
-                import traceback
-                traceback.print_exc()
+                print(f"\n{'='*80}")
+                print(f"Processing: {sheet_name}")
+                print(f"{'='*80}")
+            else:
+                print(f"Processing: {sheet_name}...")
+
+            try:
+                if executor is not None:
+                    sheet_data = futures[idx].result()
+                else:
+                    df = xl_file.parse(sheet_name, header=None)
+                    sheet_data = process_sheet(df, sheet_name, verbose=verbose)
+
+                # Add to all data
+                for col in OUTPUT_COLUMNS:
+                    all_data[col].extend(sheet_data[col])
+                print(f"  -> {len(sheet_data['GROUP'])} available apartments")
+
+            except Exception as e:
+                print(f"❌ Error processing sheet '{sheet_name}': {e}")
+                if verbose:
+                    import traceback
+                    traceback.print_exc()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        xl_file.close()
 
     # ========================================================================
     # GENERATE SUMMARY REPORT
@@ -455,11 +585,11 @@ def main(
 
     print("\nGENERATING SUMMARY REPORT")
 
-    if not all_data:
+    if not all_data['GROUP']:
         print("❌ No data extracted. Cannot generate report.")
         return
 
-    print(f"Total apartments found: {len(all_data)}")
+    print(f"Total apartments found: {len(all_data['GROUP'])}")
 
     # Generate summary
     summary = generate_summary(all_data)
@@ -481,17 +611,18 @@ def main(
 
     try:
         # Save with formatting
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        with pd.ExcelWriter(output_path, engine=EXCEL_WRITER_ENGINE) as writer:
             summary.to_excel(writer, sheet_name='Summary', index=False)
 
             # Auto-adjust column widths
             worksheet = writer.sheets['Summary']
+            value_lengths = summary.astype(str).apply(lambda values: values.str.len().max())
             for idx, col in enumerate(summary.columns):
-                max_length = max(
-                    summary[col].astype(str).apply(len).max(),
-                    len(col)
-                ) + 2
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length, 50)
+                width = min(max(value_lengths[col], len(col)) + 2, 50)
+                if EXCEL_WRITER_ENGINE == 'xlsxwriter':
+                    worksheet.set_column(idx, idx, width)
+                else:
+                    worksheet.column_dimensions[get_column_letter(idx + 1)].width = width
 
         print("✅ Report saved successfully!")
 